@@ -4,6 +4,7 @@ from crawler.worker import Worker
 class Crawler(object):
     def __init__(self, config, restart, frontier_factory=Frontier, worker_factory=Worker):
         self.config = config
+        self.config.restart = restart
         self.frontier = frontier_factory(config, restart)
         self.workers = list()
         self.worker_factory = worker_factory
@@ -17,8 +17,8 @@ class Worker(Thread):
         super().__init__(daemon=True)
         
     def run(self):
-        # Helper function to intialize scraper
-        scraper.init()
+        # Helper function to intialize scraper, discarding its previous progress on restart
+        scraper.init(self.config.restart)
         
         while True:
             tbd_url = self.frontier.get_tbd_url()
@@ -4,15 +4,22 @@ Using the original files provided, we are to help construct the core of a web cr
 This crawler is to go through only certain domains and collect various information.
 The information obtained will be used to ouput a report showing our crawler's results.
 """
-import dill as pickle
+import atexit
+import hashlib
 import json
+import pickle
 import re
 
-from bs4 import BeautifulSoup
-from bs4 import Comment
 from collections import Counter
-from itertools import islice
+from functools import lru_cache
+from lxml import etree
+from lxml.html import HTMLParser
+from lxml.html import document_fromstring
 from os import path
+from os import remove
+from os import replace
+from threading import Lock
+from threading import RLock
 from simhash import Simhash
 from simhash import SimhashIndex
 from utils import get_logger
@@ -21,6 +28,7 @@ from utils import get_urlhash
 from urllib.parse import quote_plus
 from urllib.parse import urljoin
 from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from urllib.robotparser import RobotFileParser
 
 # Global variables to track simhash values, log information, record scraper info obtained
@@ -29,194 +37,373 @@ robot_parsers = {}
 scraper_info = {'unique_pages': 0, 'longest_page_url': '', 'longest_page_count': 0}
 simhash_index = SimhashIndex([], k=3)
 
-def init():
+# Scraper info is kept in memory and only noted on disk every so many updates
+_FLUSH_EVERY = 100
+_DIRTY_COUNTER = 0
+_SCRAPER_INFO_LOCK = RLock()
+
+# The simhash index is likewise only noted on disk every so many additions
+_SIMHASH_FLUSH_EVERY = 500
+_SIMHASH_DIRTY = 0
+
+# Digests of the exact contents of pages seen, checked before the costlier near-duplicate query
+_EXACT_HASHES = set()
+
+# Guards the simhash index and exact digests shared by the workers, including while pickling
+_SIMHASH_LOCK = RLock()
+
+# Word and subdomain counts are kept in memory, with each encounter also appended to a log on
+# disk through a file handle kept open for the whole crawl
+_WORD_COUNTER = Counter()
+_SUBDOMAIN_COUNTER = Counter()
+_WORD_FH = None
+_SUB_FH = None
+_COUNTS_LOCK = Lock()
+
+# Guards against each worker restoring the previous state of the scraper
+_INIT_LOCK = Lock()
+_initialized = False
+
+# Patterns used while scraping, compiled once rather than on every page or link
+_CONTENT_TYPE_RE = re.compile('text|html')
+_BODY_TAG_RE = re.compile(rb'<body', re.IGNORECASE)
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"(?:<meta[^>]+charset|<\?xml[^>]+encoding)=[\"']?([\w.:-]+)", re.IGNORECASE)
+_PERCENT_RE = re.compile('%')
+_SCHEME_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:")
+_WORD_RE = re.compile("[a-zA-Z0-9@#*&']{2,}")
+_DATE_PATH_RE = re.compile(r"/index\.[a-zA-Z]+.?$|/page/[0-9]+.?$"
+                           + r"|/[0-9]{4}/[0-9]{2}.?$|/[0-9]{4}/[0-9]{2}/[0-9]{2}.?$"
+                           + r"|/[0-9]{4}-[0-9]{2}.?$|/[0-9]{4}-[0-9]{2}-[0-9]{2}.?$")
+
+# Pages are only parsed up to this many bytes so pathologically large pages do not stall the crawler
+_MAX_PARSE_BYTES = 2_000_000
+
+# A <meta> charset or XML declaration is expected to appear within this many bytes from the start of a page
+_META_CHARSET_BYTES = 4096
+
+# Tags whose text is not visible to the user, and queries for the visible text and links within
+# the body of a page, run by libxml2 in one pass each
+_SKIP_TAGS = frozenset({'style', 'script', 'head', 'title', 'meta', 'noscript'})
+_VISIBLE_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::*["
+                                  + " or ".join(f"self::{tag}" for tag in sorted(_SKIP_TAGS))
+                                  + "])]", smart_strings=False)
+_LINK_XPATH = etree.XPath(".//a[@href][string()]")
+
+# Protocols, domains the crawler is restricted to, and extensions of pages that are not to be crawled
+_SCHEMES = frozenset(("http", "https"))
+_ALLOWED_SUFFIXES = ('.ics.uci.edu', '.cs.uci.edu', '.informatics.uci.edu', '.stat.uci.edu')
+_BAD_EXTS = frozenset({
+    'css', 'js', 'bmp', 'gif', 'jpg', 'jpeg', 'ico',
+    'png', 'tif', 'tiff', 'mid', 'mp2', 'mp3', 'mp4',
+    'wav', 'avi', 'mov', 'mpeg', 'ram', 'm4v', 'mkv', 'ogg', 'ogv', 'pdf',
+    'ps', 'eps', 'tex', 'ppt', 'pptx', 'doc', 'docx', 'xls', 'xlsx', 'names',
+    'data', 'dat', 'exe', 'bz2', 'tar', 'msi', 'bin', '7z', 'psd', 'dmg', 'iso',
+    'apk', 'epub', 'dll', 'cnf', 'tgz', 'sha1',
+    'thmx', 'mso', 'arff', 'rtf', 'jar', 'csv',
+    'r', 'py', 'rkt', 'ss', 'sas', 'java', 'in', 'scm', 'odc', 'm',
+    'rm', 'smil', 'wmv', 'swf', 'wma', 'zip', 'rar', 'gz'})
+_MAX_EXT_LEN = max(len(extension) for extension in _BAD_EXTS) + 1
+
+# Stop words are read once rather than on every page, relative to this file so importing the
+# module does not depend on the working directory
+with open(path.join(path.dirname(__file__), 'stop_words.txt')) as _f:
+    _STOP_WORDS = frozenset(word.strip() for word in _f.read().split(','))
+
+def init(restart=False):
     """
     The init function helps to start our scraper for the web crawler in case the crawler was stopped
     in the middle of its traversal previously
+    
+    Args:
+        restart (bool): A boolean indicating if previous progress should be removed instead of restored
     """
     global scraper_info
     global simhash_index
+    global _WORD_FH
+    global _SUB_FH
+    global _initialized
     text_file = 'scraper_info.txt'
     pickle_file = 'simhash_index.pkl'
+    word_file = 'word_frequencies.txt'
+    subdomain_file = 'subdomain_count.txt'
     
-    if path.isfile(text_file) and path.isfile(pickle_file):
-        with open(text_file) as tf:
-            scraper_info = json.load(tf)
+    # Only the first worker to start restores the previous state of the scraper
+    with _INIT_LOCK:
+        if _initialized:
+            return
+        
+        # Removes the previous progress of the scraper when the crawler is restarted from its seeds
+        if restart:
+            for state_file in (text_file, pickle_file, word_file, subdomain_file):
+                if path.isfile(state_file):
+                    logger.info(f"Found scraper file {state_file}, deleting it.")
+                    remove(state_file)
+        
+        # Each file is restored on its own as they are noted on disk at different intervals, and a
+        # file that cannot be read leaves its part of the state empty rather than stopping the workers
+        if path.isfile(text_file):
+            try:
+                with open(text_file) as tf:
+                    scraper_info = json.load(tf)
+            except (OSError, ValueError) as error:
+                logger.error(f"Error restoring '{text_file}' in 'init' function: {error}")
+        
+        if path.isfile(pickle_file):
+            try:
+                with open(pickle_file, 'rb') as pf:
+                    simhash_index = pickle.load(pf)
+            except (OSError, ValueError, EOFError, ImportError, AttributeError, pickle.UnpicklingError) as error:
+                logger.error(f"Error restoring '{pickle_file}' in 'init' function: {error}")
+        
+        # Rebuilds the counts from the logs in one read each, as words and subdomains hold no whitespace
+        if path.isfile(word_file):
+            try:
+                with open(word_file, encoding='utf-8') as wf:
+                    _WORD_COUNTER.update(wf.read().split())
+            except (OSError, ValueError) as error:
+                logger.error(f"Error restoring '{word_file}' in 'init' function: {error}")
         
-        with open(pickle_file, rb) as pf:
-            simhash_index = pickle.load(pf)
+        if path.isfile(subdomain_file):
+            try:
+                with open(subdomain_file, encoding='utf-8') as sf:
+                    _SUBDOMAIN_COUNTER.update(sf.read().split())
+            except (OSError, ValueError) as error:
+                logger.error(f"Error restoring '{subdomain_file}' in 'init' function: {error}")
+        
+        # Opens the logs of words and subdomains once with a large buffer so writes coalesce
+        _WORD_FH = open(word_file, mode='a', encoding='utf-8', buffering=1 << 16)
+        _SUB_FH = open(subdomain_file, mode='a', encoding='utf-8', buffering=1 << 16)
+        
+        # Ensures any pending scraper info, simhash values, and logs are noted on disk when the crawler exits
+        atexit.register(_persist_scraper_info)
+        atexit.register(_flush_simhash_index)
+        atexit.register(_close_logs)
+        
+        # Marks the scraper as started only once the logs are open for the other workers to use
+        _initialized = True
 
-def add_unique_page():
+def _persist_scraper_info():
     """
-    The add_unique_page function updates the number of unique pages encountered by our crawler and
-    notes it on disk for review afterwards
+    The _persist_scraper_info helper function notes the scraper info kept in memory on disk for
+    review afterwards
     
-    Raises:
-        OSError: If file cannot be opened
+    Note:
+        The info is written to a temporary file which then replaces 'scraper_info.txt', so the
+        file on disk is never left truncated or partially written
     """
-    global scraper_info
+    global _DIRTY_COUNTER
     
-    try:
-        file = open('scraper_info.txt', mode='w+', encoding='utf-8')
-    except OSError as error:
-        logger.error(f"OSError with 'add_unique_page' function: {error}")
-    else:
+    with _SCRAPER_INFO_LOCK:
+        try:
+            with open('scraper_info.txt.tmp', mode='w', encoding='utf-8') as file:
+                file.write(json.dumps(scraper_info))
+            replace('scraper_info.txt.tmp', 'scraper_info.txt')
+        except OSError as error:
+            logger.error(f"OSError with '_persist_scraper_info' function: {error}")
+        else:
+            _DIRTY_COUNTER = 0
+
+def _mark_scraper_info_dirty():
+    """
+    The _mark_scraper_info_dirty helper function records that the scraper info has changed and
+    notes it on disk once enough changes have built up
+    """
+    global _DIRTY_COUNTER
+    
+    with _SCRAPER_INFO_LOCK:
+        _DIRTY_COUNTER += 1
+        if _DIRTY_COUNTER >= _FLUSH_EVERY:
+            _persist_scraper_info()
+
+def add_unique_page():
+    """
+    The add_unique_page function updates the number of unique pages encountered by our crawler and
+    periodically notes it on disk for review afterwards
+    """
+    with _SCRAPER_INFO_LOCK:
         scraper_info['unique_pages'] += 1
-        json.dump(scraper_info, file)
-    finally:
-        file.close()
+        _mark_scraper_info_dirty()
 
 def update_longest_page(url, count):
     """
     The update_longest_page function updates the page with the longest number of words encountered
-    by our crawler and notes it on disk for review afterwards
+    by our crawler and periodically notes it on disk for review afterwards
+    
+    Note:
+        The count is compared again while holding the lock as another worker may have recorded
+        a longer page since the caller checked
     
     Args:
         url (str): A string of the page
         count (int): A integer for the number of words in the page
-    
-    Raises:
-        OSError: If file cannot be opened
     """
-    global scraper_info
-    
-    try:
-        file = open('scraper_info.txt', mode='w+', encoding='utf-8')
-    except OSError as error:
-        logger.error(f"OSError with 'update_longest_page' function: {error}")
-    else:
+    with _SCRAPER_INFO_LOCK:
+        if count <= scraper_info['longest_page_count']:
+            return
         scraper_info['longest_page_url'] = url
         scraper_info['longest_page_count'] = count
-        json.dump(scraper_info, file)
-    finally:
-        file.close()
+        _mark_scraper_info_dirty()
 
 def update_common_words(word_list):
     """
-    The update_common_words function adds the words encountered in a page by our crawler and notes
-    it on disk for review afterwards
+    The update_common_words function adds the words encountered in a page by our crawler to
+    the running word counts and notes them on disk for review afterwards
     
     Args:
         word_list (list): A list of words found for a page
-    
-    Raises:
-        OSError: If file cannot be opened
     """
-    try:
-        file = open('word_frequencies.txt', mode='a+', encoding='utf-8')
-    except OSError as error:
-        logger.error(f"Error with 'update_common_words' function: {error}")
-    else:
-        for word in word_list:
-            file.write(f"{word}\n")
-    finally:
-        file.close()
+    with _COUNTS_LOCK:
+        _WORD_COUNTER.update(word_list)
+        if word_list:
+            _WORD_FH.write('\n'.join(word_list) + '\n')
 
 def update_subdomains(authority):
     """
-    The update_subdomains function adds the page encounter and notes it on disk for review afterwards
-    if the page is a subdomain of 'ics.uci.edu'
+    The update_subdomains function adds the page encounter to the running subdomain counts
+    and notes it on disk for review afterwards if the page is a subdomain of 'ics.uci.edu'
     
     Args:
         authority (str): A string of the subdomain encountered
+    """
+    with _COUNTS_LOCK:
+        _SUBDOMAIN_COUNTER[authority] += 1
+        _SUB_FH.write(f"{authority}\n")
+
+def _close_logs():
+    """
+    The _close_logs helper function closes the logs of words and subdomains once no worker is
+    writing to them
+    """
+    with _COUNTS_LOCK:
+        _WORD_FH.close()
+        _SUB_FH.close()
+
+def _flush_simhash_index():
+    """
+    The _flush_simhash_index helper function notes the index of simhash values kept in memory on
+    disk for review afterwards
     
-    Raises:
-        OSError: If file cannot be opened
+    Note:
+        The index is written to a temporary file which then replaces 'simhash_index.pkl', so the
+        file on disk is never left truncated or partially written
     """
-    try:
-        file = open('subdomain_count.txt', mode='a+', encoding='utf-8')
-    except OSError as error:
-        logger.error(f"Error with 'update_subdomains' function: {error}")
-    else:
-        file.write(f"{authority}\n")
-    finally:
-        file.close()
+    global _SIMHASH_DIRTY
+    
+    with _SIMHASH_LOCK:
+        try:
+            with open('simhash_index.pkl.tmp', mode='wb') as file:
+                pickle.dump(simhash_index, file, protocol=pickle.HIGHEST_PROTOCOL)
+            replace('simhash_index.pkl.tmp', 'simhash_index.pkl')
+        except OSError as error:
+            logger.error(f"OSError with '_flush_simhash_index' function: {error}")
+        else:
+            _SIMHASH_DIRTY = 0
 
 def update_simhash_index(url, simhash_object):
     """
     The update_simhash_index function updates the index of simhash values obtained when crawling
-    and notes it on disk for review afterwards
+    and periodically notes it on disk for review afterwards
     
     Args:
         url (str): A string of the page
-        count (object): A Simhash object that represents the contents of the page
-    
-    Raises:
-        OSError: If file cannot be opened
+        simhash_object (object): A Simhash object that represents the contents of the page
     """
-    global simhash_index
+    global _SIMHASH_DIRTY
     
-    try:
-        file = open('simhash_index.pkl', mode='wb+')
-    except OSError as error:
-        logger.error(f"OSError with 'update_longest_page' function: {error}")
-    else:
+    with _SIMHASH_LOCK:
         simhash_index.add(get_urlhash(url), simhash_object)
-        pickle.dump(simhash_index, file)
-    finally:
-        file.close()
+        _SIMHASH_DIRTY += 1
+        if _SIMHASH_DIRTY >= _SIMHASH_FLUSH_EVERY:
+            _flush_simhash_index()
+
+def _simhash_hashfunc(token):
+    """
+    The _simhash_hashfunc helper function hashes a feature of a page for its Simhash, using a
+    64-bit blake2b digest in place of the slower default of MD5
+    
+    Args:
+        token (bytes): A utf-8 encoded word found in a page
+    
+    Returns:
+        The 8 bytes of the hash of the word
+    """
+    return hashlib.blake2b(token, digest_size=8).digest()
+
+def page_encoding(raw, content_type):
+    """
+    The page_encoding function determines the charset a page should be decoded with before it
+    is parsed
+    
+    Note:
+        When left to detect the charset itself, lxml ignores the 'content-type' header, misreads
+        pages starting with an XML declaration, and decodes pages without a <meta> charset as
+        Latin-1, so the charset is always determined here and pages with neither a header nor a
+        charset within the page are decoded as UTF-8
+    
+    Args:
+        raw (bytes): The contents of the page
+        content_type (str): A string of the 'content-type' header of the page
+    
+    Returns:
+        A string of the charset of the page
+    """
+    # Uses the charset from the header as it takes precedence over one within the page
+    match = _CHARSET_RE.search(content_type)
+    if match:
+        return match.group(1)
+    
+    match = _META_CHARSET_RE.search(raw[:_META_CHARSET_BYTES])
+    if match:
+        return match.group(1).decode('ascii')
+    
+    return 'utf-8'
 
 def calc_content(url, body):
     """
     The calc_content function determines if a page is valid through the contents found within it
     
     Args:
-        body (object): A BeautifulSoup object containing the body tag of a web page
+        url (str): A string representing the URL of the page
+        body (object): An lxml HtmlElement containing the body tag of a web page
     
     Returns:
         A boolean indicating if the page has low information value and a list of the words
         within it if it does not
-    """  
-    def visible_tag(element):
-        """
-        The visible_tag helper function determines if a tag in a page is visible to the user
-        
-        Note:
-            The below function was obtained through an outside source found on
-            https://stackoverflow.com/questions/1936466/beautifulsoup-grab-visible-webpage-text
-        
-        Args:
-            element (object): A Tag object containing a reference link
-        
-        Returns:
-            A boolean indicating if the tag is visible to the user
-        """
-        if element.parent.name in ['style', 'script', 'head', 'title', 'meta', '[document]']:
-            return False
-        
-        # Checks if tag is being used as a comment within the page
-        elif isinstance(element, Comment):
-            return False
-        
-        else:
-            return True
-    
-    # Extracts visible text from page and joins it into a string
-    # https://stackoverflow.com/questions/1936466/beautifulsoup-grab-visible-webpage-text
-    all_text = body.find_all(text=True)
-    visible_text = filter(visible_tag, all_text)
-    combined_text = u" ".join(text.strip().lower() for text in visible_text)
-    
-    # Sets up word requirements
-    with open('stop_words.txt') as file:
-        stop_words = set(file.read().split(','))
-    pattern = re.compile("[a-zA-Z0-9@#*&']{2,}")
-    
-    # Determines list of words and valid words in page
-    word_list = pattern.findall(combined_text)
-    valid_word_list = [word for word in word_list if not word in stop_words]
+    """
+    # Extracts visible text from page
+    # Text within comments is not matched by text() and so is already excluded
+    visible_text = _VISIBLE_TEXT_XPATH(body)
+    
+    # Determines valid words in page one text node at a time, lowering each word as it is found
+    valid_word_list = []
+    append = valid_word_list.append
+    for text in visible_text:
+        for word in _WORD_RE.findall(text):
+            word = word.lower()
+            if word not in _STOP_WORDS:
+                append(word)
     
     # Checks if page has low information value
     valid_size = len(valid_word_list)
     if valid_size < 50 or (len(set(valid_word_list)) / valid_size) < 0.2:
         return True, []
     
+    # Checks if contents of page is identical to a previously crawled page
+    exact_hash = hashlib.blake2b('\0'.join(valid_word_list).encode('utf-8'), digest_size=16).digest()
+    with _SIMHASH_LOCK:
+        if exact_hash in _EXACT_HASHES:
+            return True, []
+        _EXACT_HASHES.add(exact_hash)
+    
     # Checks if contents of page is similar to a previously crawled page
-    simhash_value = Simhash(valid_word_list)
-    if simhash_index.get_near_dups(simhash_value):
-        return True, []
-    else:
-        update_simhash_index(url, simhash_value)
+    # Words are passed with their counts so each distinct word is only hashed once
+    simhash_value = Simhash(Counter(valid_word_list), hashfunc=_simhash_hashfunc)
+    with _SIMHASH_LOCK:
+        if simhash_index.get_near_dups(simhash_value):
+            return True, []
+        else:
+            update_simhash_index(url, simhash_value)
     
     return False, valid_word_list
 
@@ -239,18 +426,32 @@ def scraper(url, resp):
         return extracted_links
     
     # Checks if URL has a valid response status (i.e., less than 400)
-    if not resp.status in range(200, 400):
+    if not (200 <= resp.status < 400):
         return extracted_links
     
     # Checks if URL has a valid content-type header
-    pattern = re.compile('text|html')
     content_type = resp.raw_response.headers.get('content-type', '')
-    if re.search(pattern, content_type) is None:
+    if _CONTENT_TYPE_RE.search(content_type) is None:
+        return extracted_links
+    
+    # Checks if the page has a <body> tag before parsing it, capping the input parsed
+    raw = resp.raw_response.content[:_MAX_PARSE_BYTES]
+    if _BODY_TAG_RE.search(raw) is None:
         return extracted_links
     
+    # Sets up the parser to decode the page with the charset it was served with
+    try:
+        parser = HTMLParser(encoding=page_encoding(raw, content_type))
+    except LookupError:
+        parser = HTMLParser(encoding='utf-8')
+    
     # Grabs the contents of page from <body> tag
-    body = BeautifulSoup(resp.raw_response.content, 'lxml').body
-    if not body:
+    try:
+        tree = document_fromstring(raw, parser=parser)
+    except etree.ParserError:
+        return extracted_links
+    body = tree.find('body')
+    if body is None:
         return extracted_links
     
     # Checks if the page is invalid
@@ -265,7 +466,7 @@ def scraper(url, resp):
     if page_count > scraper_info['longest_page_count']:
         update_longest_page(url, page_count)
     update_common_words(word_list)
-    authority = urlparse(url).netloc
+    authority = urlsplit(url).netloc
     if authority.endswith('.ics.uci.edu'):
         update_subdomains(authority)
     
@@ -280,41 +481,59 @@ def extract_next_links(url, body):
     
     Args:
         url (str): A string representing the URL of the page
-        resp (object): A Tag object containing body of the page
+        body (object): An lxml HtmlElement containing the body tag of a web page
     
     Returns:
         A list of links extracted from the page
     """
-    # Extracts the list of links present in the page
+    # Extracts the list of links present in the page where the tag has text associated to it
     links = set()
-    link_locations = body.find_all('a', href=True)
+    link_locations = _LINK_XPATH(body)
+    parsed_page = urlsplit(url)
+    origin = f"{parsed_page.scheme}://{parsed_page.netloc}/"
     
-    # Iterates through each link where the tag has text associated to it
+    # Iterates through each link found, resolving it against the least specific base that gives
+    # the same result so that links repeated across pages share a cache entry
     for tag in link_locations:
-        if tag.text:
-            
-            # Obtaines the parsed URL of the extracted link
-            extracted_url = tag['href']
-            parsed_url = urlparse(extracted_url)
-            if not parsed_url.scheme:
-                updated_url = urljoin(url, extracted_url)
-                parsed_url = urlparse(updated_url)
-            
-            # Update the path structure for storing
-            path = parsed_url.path
-            if re.search('%', path) is None:
-                path = quote_plus(parsed_url.path, safe='/')
-            pattern = re.compile(r"/index\.[a-zA-Z]+.?$|/page/[0-9]+.?$"
-                                 + r"|/[0-9]{4}/[0-9]{2}.?$|/[0-9]{4}/[0-9]{2}/[0-9]{2}.?$"
-                                 + r"|/[0-9]{4}-[0-9]{2}.?$|/[0-9]{4}-[0-9]{2}-[0-9]{2}.?$")
-            new_path = pattern.sub('/', path)
-            
-            # Grabs core parts of URL and adds them to extracted links
-            updated_url = f"{parsed_url.scheme.lower()}://{parsed_url.netloc.lower()}{new_path}"
-            links.add(updated_url)
+        extracted_url = tag.get('href')
+        if _SCHEME_RE.match(extracted_url):
+            base_url = ''
+        elif extracted_url.startswith('/'):
+            base_url = origin
+        else:
+            base_url = url
+        links.add(_normalize_link(base_url, extracted_url))
     
     return links
 
+@lru_cache(maxsize=200000)
+def _normalize_link(base_url, extracted_url):
+    """
+    The _normalize_link helper function resolves a link extracted from a page and reduces it to
+    the core parts of the URL for storing
+    
+    Args:
+        base_url (str): A string representing the URL the link is relative to
+        extracted_url (str): A string representing the link as it appears in the page
+    
+    Returns:
+        A string of the normalized link
+    """
+    # Obtaines the parsed URL of the extracted link
+    parsed_url = urlparse(extracted_url)
+    if not parsed_url.scheme:
+        updated_url = urljoin(base_url, extracted_url)
+        parsed_url = urlparse(updated_url)
+    
+    # Update the path structure for storing
+    path = parsed_url.path
+    if _PERCENT_RE.search(path) is None:
+        path = quote_plus(parsed_url.path, safe='/')
+    new_path = _DATE_PATH_RE.sub('/', path)
+    
+    # Grabs core parts of URL
+    return f"{parsed_url.scheme.lower()}://{parsed_url.netloc.lower()}{new_path}"
+
 def repetitive_pattern(path):
     """
     The repetitive_pattern function reviews the path of a page and checks to see if the
@@ -342,12 +561,46 @@ def repetitive_pattern(path):
     else:
         return False
 
-def check_robots_file(url):
+def invalid_extension(path):
+    """
+    The invalid_extension function reviews the path of a page and checks to see if it ends
+    with the extension of a file type that should not be crawled
+    
+    Note:
+        An extension followed by a single trailing character (e.g., '.pdf/') is also
+        considered to be invalid
+    
+    Args:
+        path (str): A string representing the path of a page
+    
+    Returns:
+        A boolean indicating if the path ends with an invalid extension
+    """
+    # Splits off the text after the last '.' in the path
+    stem, dot, extension = path.rpartition('.')
+    if not dot:
+        return False
+    
+    # Checks the extension before a trailing '.' if one is present
+    if not extension:
+        stem, dot, extension = stem.rpartition('.')
+        return bool(dot) and extension.lower() in _BAD_EXTS
+    
+    # Text too long to be an extension plus a trailing character is skipped without lowering it
+    if len(extension) > _MAX_EXT_LEN:
+        return False
+    
+    extension = extension.lower()
+    return extension in _BAD_EXTS or extension[:-1] in _BAD_EXTS
+
+def _can_fetch(authority, scheme, url):
     """
-    The check_robots_file function reviews the URL and looks at the 'robots.txt' file of the
-    site to see if the page should be fetched or not
+    The _can_fetch helper function looks at the 'robots.txt' file of the site to see if the page
+    should be fetched or not
     
     Args:
+        authority (str): A string representing the authority of the page
+        scheme (str): A string representing the scheme of the page
         url (str): A string representing the URL of the page
     
     Returns:
@@ -355,12 +608,9 @@ def check_robots_file(url):
     """
     global robot_parsers
     
-    parsed_url = urlparse(url)
-    authority = parsed_url.netloc
-    
     # Checks if robots_parser of domain was found before
     if not authority in robot_parsers:
-        rp = RobotFileParser(url=f"{parsed_url.scheme}://{authority}/robots.txt")
+        rp = RobotFileParser(url=f"{scheme}://{authority}/robots.txt")
         try:
             rp.read()
         except:
@@ -376,11 +626,16 @@ def check_robots_file(url):
         can_crawl = rp.can_fetch('*', url)
         return can_crawl
 
+@lru_cache(maxsize=200000)
 def is_valid(url):
     """
     The is_valid function reviews the URL of a page and determines if the page link
     is valid for the crawler to traverse
     
+    Note:
+        Results are cached per URL as the checks only depend on the URL itself and the
+        'robots.txt' file of its domain, which is only read once
+    
     Args:
         url (str): A string representing the URL of the page
     
@@ -388,35 +643,29 @@ def is_valid(url):
         A boolean indicating if the URL is valid for the crawler to traverse
     """
     # Parses the link
-    parsed_url = urlparse(url)
+    parsed_url = urlsplit(url)
     authority = parsed_url.netloc
     path = parsed_url.path
     
-    # Checks if the link should be traversed based on restrictoin of domain name
-    url_pattern = re.compile("\.ics\.uci\.edu$|\.cs\.uci\.edu$|\.informatics\.uci\.edu$|\.stat\.uci\.edu$")
-    if url_pattern.search(authority) is None and not f"{authority}{path}".startswith('today.uci.edu/department/information_computer_sciences/'):
+    # Checks are ordered from cheapest to most expensive so most links are rejected early
+    # Checks if the link should be traversed based on valid protocol
+    if parsed_url.scheme not in _SCHEMES:
         return False
     
-    # Checks if the link should be traversed based on no repeating path patterns and valid protocol
-    if parsed_url.scheme not in set(["http", "https"]):
-        return False
-    if repetitive_pattern(path):
+    # Checks if the link should be traversed based on restrictoin of domain name
+    if not authority.endswith(_ALLOWED_SUFFIXES) and not (authority == 'today.uci.edu' and path.startswith('/department/information_computer_sciences/')):
         return False
     
     # Checks if the link should be traverse based on extension of URL
-    extension_pattern = re.compile(r"\.(css|js|bmp|gif|jpe?g|ico"
-                                   + r"|png|tiff?|mid|mp2|mp3|mp4"
-                                   + r"|wav|avi|mov|mpeg|ram|m4v|mkv|ogg|ogv|pdf"
-                                   + r"|ps|eps|tex|ppt|pptx|doc|docx|xls|xlsx|names"
-                                   + r"|data|dat|exe|bz2|tar|msi|bin|7z|psd|dmg|iso"
-                                   + r"|apk|epub|dll|cnf|tgz|sha1"
-                                   + r"|thmx|mso|arff|rtf|jar|csv"
-                                   + r"|r|py|rkt|ss|sas|java|in|scm|odc|m"
-                                   + r"|rm|smil|wmv|swf|wma|zip|rar|gz).?$")
-    if extension_pattern.search(path.lower()):
+    if invalid_extension(path):
         return False
     
-    if not check_robots_file(url):
+    # Checks if the link should be traversed based on no repeating path patterns
+    if repetitive_pattern(path):
+        return False
+    
+    # Checks 'robots.txt' last as the first check of a domain fetches the file over the network
+    if not _can_fetch(authority, parsed_url.scheme, url):
         return False
     
     return True
@@ -426,46 +675,26 @@ def create_report():
     The create_report function outputs the results of our web crawler and provides details based
     on the requested information asked
     """
+    # Write the number of unique pages found and longest page
+    lines = [f"Number of unique pages found:\n{scraper_info['unique_pages']}\n",
+             f"\nLongest page found:\n{scraper_info['longest_page_url']}\n",
+             f"{scraper_info['longest_page_count']} words present\n"]
+    
+    # Write the 50 most frequent words found
+    lines.append('\nMost common words:\n')
+    for (word, frequency) in _WORD_COUNTER.most_common(50):
+        lines.append(f"{word}, {frequency}\n")
+    
+    # Write the subdomains found and their counts
+    lines.append('\nSubdomains found:\n')
+    for subdomain in sorted(_SUBDOMAIN_COUNTER):
+        lines.append(f"{subdomain}, {_SUBDOMAIN_COUNTER[subdomain]}\n")
+    
+    # Outputs the report in a single write
     try:
         file = open('report_info.txt', mode='w+', encoding='utf-8')
     except OSError as error:
         logger.error(f"OSError with 'create_report' function: {error}")
     else:
-        # Write the number of unique pages found and longest page
-        file.write(f"Number of unique pages found:\n{scraper_info['unique_pages']}\n")
-        file.write(f"\nLongest page found:\n{scraper_info['longest_page_url']}\n")
-        file.write(f"{scraper_info['longest_page_count']} words present\n")
-        
-        # Create counters for tracking unique words and subdomains
-        word_frequencies = Counter()
-        subdomain_count = Counter()
-        
-        # Loop through every 1000 unique words and store them into Counter
-        with open('word_frequencies.txt') as wf:
-            while True:
-                next_lines = list(islice(wf, 100))
-                if not next_lines:
-                    break
-                updated_lines = [line.strip() for line in next_lines]
-                word_frequencies.update(updated_lines)
-        
-        # Loop through every 1000 subdomains and store them into Counter
-        with open('subdomain_count.txt') as sc:
-            while True:
-                next_lines = list(islice(sc, 100))
-                if not next_lines:
-                    break
-                updated_lines = [line.strip() for line in next_lines]
-                subdomain_count.update(updated_lines)
-        
-        # Write the 50 most frequent words found
-        file.write('\nMost common words:\n')
-        for (word, frequency) in word_frequencies.most_common(50):
-            file.write(f"{word}, {frequency}\n")
-        
-        # Write the subdomains found and their counts
-        file.write('\nSubdomains found:\n')
-        for (subdomain, count) in sorted(subdomain_count.items()):
-            file.write(f"{subdomain}, {count}\n")
-    finally:
-        file.close()
+        with file:
+            file.write("".join(lines))